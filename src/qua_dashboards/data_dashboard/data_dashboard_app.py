@@ -1,5 +1,6 @@
+import json
 import time
-from typing import Optional
+from typing import Any, Optional
 
 import dash
 import dash_bootstrap_components as dbc
@@ -17,6 +18,23 @@ from qua_dashboards.data_dashboard.data_components import (
     StandardComponent,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(payload: bytes) -> Any:
+    """Parses a JSON payload, using orjson when it is installed.
+
+    orjson rejects the NaN/Infinity literals that the client's stdlib JSON
+    encoding emits for arrays with missing values, so such payloads go
+    straight to the stdlib parser instead of being parsed twice.
+    """
+    if orjson is not None and b"NaN" not in payload and b"Infinity" not in payload:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class DataDashboardApp:
     def __init__(
@@ -179,7 +197,13 @@ class DataDashboardApp:
 
         @server.route("/data-dashboard/update-data", methods=["POST"])
         def update_data_endpoint():
-            serialised_data = request.json
+            if not request.is_json:
+                # Same error response as `request.json` for a non-JSON body.
+                return request.on_json_loading_failed(None)
+            try:
+                serialised_data = _json_loads(request.get_data())
+            except ValueError as e:
+                return request.on_json_loading_failed(e)
             data = deserialise_data(serialised_data)
             self.update_data(data)
             return jsonify(success=True)
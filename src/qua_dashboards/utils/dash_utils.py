@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple, Optional, Any, Union
 from dash import dcc, html
 import dash_bootstrap_components as dbc
@@ -21,8 +22,8 @@ def convert_to_dash_component(elem: Union[dict, list]) -> Any:
       - dash_bootstrap_components (accessed via `dbc`)
       - dash_core_components (accessed via `dcc`)
 
-    For Graph components, if the 'figure' property is provided as a dict,
-    it is converted into a plotly.graph_objects.Figure instance.
+    Graph 'figure' properties are passed through as-is: dcc.Graph accepts
+    plain figure dicts, so they are not re-validated as a go.Figure.
 
     Args:
         elem: A dictionary or list representing a serialized Dash component.
@@ -33,45 +34,47 @@ def convert_to_dash_component(elem: Union[dict, list]) -> Any:
     Raises:
         ValueError: If an element has an unknown namespace.
     """
+    # Scalars (str, numbers, None, ...) are by far the most common leaves.
+    if not isinstance(elem, (dict, list)):
+        return elem
+
     if isinstance(elem, list):
         # Recursively convert each element in the list.
-        return [convert_to_dash_component(e) for e in elem]
-    elif isinstance(elem, dict):
-        # If the element doesn't have a "namespace" key, it's not a serialized component.
-        if "namespace" not in elem:
-            return {
-                key: convert_to_dash_component(value) for key, value in elem.items()
-            }
-
-        # Helper to process the 'children' key recursively.
-        def process_children(props: dict) -> dict:
-            if "children" in props:
-                props["children"] = convert_to_dash_component(props["children"])
-            return props
-
-        # Copy properties to avoid modifying the original dictionary.
-        props = process_children(elem["props"].copy())
-        namespace = elem["namespace"]
-        comp_type = elem["type"]
-
-        # Convert based on the namespace.
-        if namespace == "dash_html_components":
-            cls = getattr(html, comp_type)
-            return cls(**props)
-        elif namespace == "dash_bootstrap_components":
-            cls = getattr(dbc, comp_type)
-            return cls(**props)
-        elif namespace == "dash_core_components":
-            cls = getattr(dcc, comp_type)
-            # Special handling for Graph: convert a dict figure into a Figure object.
-            if comp_type == "Graph" and isinstance(props.get("figure"), dict):
-                props["figure"] = go.Figure(**props["figure"])
-            return cls(**props)
-        else:
-            raise ValueError(f"Unknown element: {elem}")
-    else:
-        # If the element is not a dict or list, return it unchanged.
-        return elem
+        converted = []
+        append = converted.append
+        for e in elem:
+            append(convert_to_dash_component(e))
+        return converted
+
+    # If the element doesn't have a "namespace" key, it's not a serialized component.
+    namespace = elem.get("namespace")
+    if namespace is None:
+        return {key: convert_to_dash_component(value) for key, value in elem.items()}
+
+    module = _NAMESPACES.get(namespace)
+    if module is None:
+        raise ValueError(f"Unknown element: {elem}")
+    cls = _resolve_cls(module, elem["type"])
+
+    # Build a new props dict in a single pass, leaving the input untouched.
+    props = {
+        key: convert_to_dash_component(value) if key == "children" else value
+        for key, value in elem["props"].items()
+    }
+    return cls(**props)
+
+
+_NAMESPACES = {
+    "dash_html_components": html,
+    "dash_bootstrap_components": dbc,
+    "dash_core_components": dcc,
+}
+
+
+@lru_cache(maxsize=128)
+def _resolve_cls(module: Any, type_name: str) -> type:
+    """Returns the Dash component class `type_name` from a component module."""
+    return getattr(module, type_name)
 
 
 def create_input_field(
@@ -1,6 +1,9 @@
+import copy
 import logging
 import uuid
-from typing import Any, Dict, Union
+import weakref
+from functools import cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import dash_bootstrap_components as dbc
 import dash
@@ -15,11 +18,25 @@ from qua_dashboards.video_mode.tab_controllers.base_tab_controller import (
 )
 from qua_dashboards.video_mode import data_registry
 
+if TYPE_CHECKING:
+    from qua_dashboards.video_mode.video_mode_component import VideoModeComponent
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["LiveViewTabController"]
 
+# (button text, button color, status text, status color) for the fixed states.
+_STATE_RUNNING = ("Stop Acquisition", "danger", "RUNNING", "success")
+_STATE_STOPPED = ("Start Acquisition", "success", "STOPPED", "secondary")
+
+
+@cache
+def _get_video_mode_component() -> "Type[VideoModeComponent]":
+    """Returns the VideoModeComponent class, imported late to avoid a cycle."""
+    from qua_dashboards.video_mode.video_mode_component import VideoModeComponent
+
+    return VideoModeComponent
+
 
 class LiveViewTabController(BaseTabController):
     """
@@ -37,7 +54,6 @@ class LiveViewTabController(BaseTabController):
     _TOGGLE_ACQ_BUTTON_ID_SUFFIX = "toggle-acq-button"
     _ACQUIRER_CONTROLS_DIV_ID_SUFFIX = "acquirer-controls-div"
     _ACQUIRER_STATUS_INDICATOR_ID_SUFFIX = "acquirer-status-indicator"
-    _DUMMY_OUTPUT_ACQUIRER_UPDATE_SUFFIX = "dummy-output-acquirer-updates"
 
     def __init__(
         self,
@@ -51,11 +67,19 @@ class LiveViewTabController(BaseTabController):
         Args:
             component_id: A unique string identifier for this component instance.
             data_acquirer: The data acquirer instance that this tab will control
-                and interact with.
+                and interact with. Only a weak reference is kept, so the owner
+                (typically the VideoModeComponent) must keep it alive.
             **kwargs: Additional keyword arguments passed to BaseComponent.
         """
         super().__init__(component_id=component_id, is_active=is_active, **kwargs)
-        self._data_acquirer_instance: BaseDataAcquirer = data_acquirer
+        self._toggle_id = self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX)
+        self._status_id = self._get_id(self._ACQUIRER_STATUS_INDICATOR_ID_SUFFIX)
+        self._controls_id = self._get_id(self._ACQUIRER_CONTROLS_DIV_ID_SUFFIX)
+        self._data_acquirer_instance: BaseDataAcquirer = weakref.proxy(data_acquirer)
+        # Last parameter values forwarded to the acquirer, keyed by component id.
+        self._last_params_snapshot: Dict[str, Dict[str, Any]] = {}
+        self._layout_shell: Optional[dbc.Card] = None
+        self._acquirer_controls_div: Optional[html.Div] = None
         logger.info(
             f"LiveViewTabController '{self.component_id}' initialized with "
             f"Data Acquirer '{self._data_acquirer_instance.component_id}'."
@@ -75,13 +99,49 @@ class LiveViewTabController(BaseTabController):
         logger.debug(
             f"Generating layout for LiveViewTabController '{self.component_id}'"
         )
+        # The static shell is built once and reused; only the acquirer
+        # controls are regenerated, as they reflect the current parameters.
+        # The shell is shallow-copied along the path to the controls div so
+        # layouts returned by earlier calls are never mutated.
+        if self._layout_shell is None:
+            self._layout_shell = self._build_layout_shell()
+
+        try:
+            acquirer_specific_controls = (
+                self._data_acquirer_instance.get_dash_components(
+                    include_subcomponents=True
+                )
+            )
+        except ReferenceError:
+            acquirer_specific_controls = [
+                html.P("Data acquirer components could not be loaded.")
+            ]
+
+        controls_div = copy.copy(self._acquirer_controls_div)
+        controls_div.children = acquirer_specific_controls
+
+        card_body = copy.copy(self._layout_shell.children)
+        card_body.children = [
+            controls_div if child is self._acquirer_controls_div else child
+            for child in card_body.children
+        ]
+
+        card = copy.copy(self._layout_shell)
+        card.children = card_body
+        return card
 
+    def _build_layout_shell(self) -> dbc.Card:
+        """Builds the static part of the control panel layout.
+
+        The acquirer controls div is stored in `self._acquirer_controls_div`
+        and left empty; `get_layout` returns copies with its children filled in.
+        """
         toggle_button_and_status = dbc.Row(
             [
                 dbc.Col(
                     dbc.Button(
                         "Start Acquisition",  # Initial text
-                        id=self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX),
+                        id=self._toggle_id,
                         color="success",  # Initial color for "Start"
                         className="me-1",
                         style={"width": "100%"},
@@ -92,7 +152,7 @@ class LiveViewTabController(BaseTabController):
                     html.Div(
                         dbc.Badge(
                             "STOPPED",  # Initial status text
-                            id=self._get_id(self._ACQUIRER_STATUS_INDICATOR_ID_SUFFIX),
+                            id=self._status_id,
                             color="secondary",  # Initial color for STOPPED
                             className="ms-1 p-2",  # Added padding
                             style={
@@ -111,15 +171,8 @@ class LiveViewTabController(BaseTabController):
             className="mb-3 align-items-center",
         )
 
-        acquirer_specific_controls = (
-            self._data_acquirer_instance.get_dash_components(include_subcomponents=True)
-            if self._data_acquirer_instance
-            else [html.P("Data acquirer components could not be loaded.")]
-        )
-
-        acquirer_controls_div = html.Div(
-            id=self._get_id(self._ACQUIRER_CONTROLS_DIV_ID_SUFFIX),  # type: ignore
-            children=acquirer_specific_controls,
+        self._acquirer_controls_div = html.Div(
+            id=self._controls_id,  # type: ignore
             className="mt-3 p-3 border rounded",
         )
 
@@ -129,11 +182,7 @@ class LiveViewTabController(BaseTabController):
                 toggle_button_and_status,
                 html.Hr(),
                 html.H6("Acquirer Parameters", className="text-light"),
-                acquirer_controls_div,
-                html.Div(
-                    id=self._get_id(self._DUMMY_OUTPUT_ACQUIRER_UPDATE_SUFFIX),  # type: ignore
-                    style={"display": "none"},
-                ),
+                self._acquirer_controls_div,
             ]
         )
         return dbc.Card(
@@ -147,7 +196,7 @@ class LiveViewTabController(BaseTabController):
         Sets the shared viewer to point to the live data stream from the
         data_registry.
         """
-        from qua_dashboards.video_mode.video_mode_component import VideoModeComponent
+        VideoModeComponent = _get_video_mode_component()
 
         logger.info(f"LiveViewTabController '{self.component_id}' activated.")
 
@@ -177,7 +226,7 @@ class LiveViewTabController(BaseTabController):
     def on_tab_deactivated(self) -> None:
         """Called by the orchestrator when this tab is no longer active."""
         logger.info(f"LiveViewTabController '{self.component_id}' deactivated.")
-        pass
+        self.is_active = False
 
     def register_callbacks(
         self,
@@ -196,14 +245,18 @@ class LiveViewTabController(BaseTabController):
         logger.info(
             f"Registering callbacks for LiveViewTabController '{self.component_id}'."
         )
-        self._register_acquisition_control_callback(app, orchestrator_stores)
-        self._register_parameter_update_callback(app)
+        self._register_live_view_callback(app, orchestrator_stores)
 
-    def _register_acquisition_control_callback(
+    def _register_live_view_callback(
         self, app: Dash, orchestrator_stores: Dict[str, Any]
     ) -> None:
-        """Registers callback for acquisition control and status updates."""
-        from qua_dashboards.video_mode.video_mode_component import VideoModeComponent
+        """Registers the callback for acquisition control, status updates and
+        data acquirer parameter updates.
+
+        A single callback serves all of these; it is routed on the triggered
+        inputs so that each interaction costs one callback dispatch.
+        """
+        VideoModeComponent = _get_video_mode_component()
 
         main_status_alert_id = orchestrator_stores.get(
             VideoModeComponent._MAIN_STATUS_ALERT_ID_SUFFIX
@@ -213,136 +266,252 @@ class LiveViewTabController(BaseTabController):
                 f"Could not find {VideoModeComponent._MAIN_STATUS_ALERT_ID_SUFFIX} "
                 "in orchestrator_stores. Status synchronization might be affected."
             )
+        tabs_id = orchestrator_stores.get(VideoModeComponent._TABS_ID_SUFFIX)
+        if tabs_id:
+            tab_inputs: Tuple[Input, ...] = (Input(tabs_id, "value"),)
+        else:
+            logger.warning(
+                f"Could not find {VideoModeComponent._TABS_ID_SUFFIX} in "
+                "orchestrator_stores. Status updates will not be limited to the "
+                "active tab."
+            )
+            tab_inputs = ()
+
+        try:
+            all_acquirer_components = self._data_acquirer_instance.get_components()
+        except ReferenceError:
+            logger.error(
+                f"LiveViewTabController '{self.component_id}': data acquirer no "
+                "longer exists. Registering callback without acquirer parameter "
+                "inputs; keep a reference to the data acquirer alive."
+            )
+            all_acquirer_components = []
+        component_ids = [
+            component.component_id for component in all_acquirer_components
+        ]
+        num_comp_types = len(all_acquirer_components)
+
+        dynamic_inputs = tuple(
+            Input(component._get_id(ALL), "value")
+            for component in all_acquirer_components
+        )
+        dynamic_states_ids = tuple(
+            State(component._get_id(ALL), "id") for component in all_acquirer_components
+        )
 
         @app.callback(
-            Output(self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX), "children"),
-            Output(self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX), "color"),
-            Output(self._get_id(self._ACQUIRER_STATUS_INDICATOR_ID_SUFFIX), "children"),
-            Output(self._get_id(self._ACQUIRER_STATUS_INDICATOR_ID_SUFFIX), "color"),
-            Input(self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX), "n_clicks"),
+            Output(self._toggle_id, "children"),
+            Output(self._toggle_id, "color"),
+            Output(self._status_id, "children"),
+            Output(self._status_id, "color"),
+            Input(self._toggle_id, "n_clicks"),
             Input(main_status_alert_id, "children"),
+            *tab_inputs,
+            *dynamic_inputs,
+            *dynamic_states_ids,
+            State(self._toggle_id, "children"),
+            State(self._toggle_id, "color"),
+            State(self._status_id, "children"),
+            State(self._status_id, "color"),
             prevent_initial_call=True,
         )
-        def handle_acquisition_control_and_status_update(
-            _toggle_clicks: Any, _status_alert_trigger: Any
-        ) -> tuple[str, str, str, str]:
+        def handle_live_view_update(
+            _toggle_clicks: Any,
+            _status_alert_trigger: Any,
+            *args: Any,
+        ) -> tuple[Any, Any, Any, Any]:
             """
-            Handles acquisition toggle and updates UI based on acquirer status.
+            Routes triggered inputs to the acquisition control/status handler
+            and the acquirer parameter handler.
             """
-            triggered_input_id_obj = ctx.triggered_id
-            is_button_click = False
-            if isinstance(triggered_input_id_obj, dict):  # Pattern matched ID
-                is_button_click = (
-                    triggered_input_id_obj.get("index")
-                    == self._TOGGLE_ACQ_BUTTON_ID_SUFFIX
-                )
-            elif isinstance(triggered_input_id_obj, str):  # Simple string ID
-                is_button_click = (
-                    self._get_id(self._TOGGLE_ACQ_BUTTON_ID_SUFFIX)
-                    == triggered_input_id_obj
-                )
-
-            acquirer_state = self._data_acquirer_instance.get_latest_data()
-            current_status = acquirer_state.get("status", "unknown").upper()
-            error_details = acquirer_state.get("error")
-
-            button_text: str
-            button_color: str
-            status_text: str
-            status_color: str
-
-            if is_button_click:
-                logger.debug(
-                    f"LiveViewTab: Toggle acquisition button clicked. "
-                    f"Current reported acquirer status: {current_status}"
-                )
-                if current_status == "RUNNING":
-                    logger.info(
-                        f"Attempting to stop acquisition for "
-                        f"'{self._data_acquirer_instance.component_id}'"
-                    )
-                    self._data_acquirer_instance.stop_acquisition()
-                    button_text, button_color = "Start Acquisition", "success"
-                    status_text, status_color = "STOPPED", "secondary"
-                else:  # Was STOPPED, ERROR, or UNKNOWN
-                    logger.info(
-                        f"Attempting to start acquisition for "
-                        f"'{self._data_acquirer_instance.component_id}'"
-                    )
-                    self._data_acquirer_instance.start_acquisition()
-                    button_text, button_color = "Stop Acquisition", "danger"
-                    status_text, status_color = "RUNNING", "success"
+            if tab_inputs:
+                is_tab_active = args[0] == self.get_tab_value()
+                args = args[1:]
             else:
-                if current_status != "STOPPED":
-                    logger.debug(
-                        f"LiveViewTab: Status update triggered externally. "
-                        f"Acquirer status: {current_status}"
-                    )
-                if current_status == "RUNNING":
-                    button_text, button_color = "Stop Acquisition", "danger"
-                    status_text, status_color = "RUNNING", "success"
-                elif current_status == "STOPPED":
-                    button_text, button_color = "Start Acquisition", "success"
-                    status_text, status_color = "STOPPED", "secondary"
-                elif current_status == "ERROR":
-                    button_text, button_color = (
-                        "Start Acquisition",
-                        "success",
+                is_tab_active = True
+
+            # Triggered ids compare equal to our ids whether they are
+            # pattern-matching dicts or plain strings.
+            triggered_ids = list(ctx.triggered_prop_ids.values())
+            status_trigger_ids = (self._toggle_id, main_status_alert_id, tabs_id)
+            is_button_click = self._toggle_id in triggered_ids
+            # Switching tabs refreshes the status, as alerts are not processed
+            # while the tab is hidden.
+            is_status_update = any(
+                triggered_id in status_trigger_ids for triggered_id in triggered_ids
+            )
+            is_parameter_update = any(
+                triggered_id not in status_trigger_ids
+                for triggered_id in triggered_ids
+            )
+
+            if is_parameter_update:
+                # A failing parameter update must not drop the status outputs
+                # of a toggle click or status alert in the same dispatch.
+                try:
+                    self._handle_acquirer_parameter_update(
+                        component_ids,
+                        args[:num_comp_types],
+                        args[num_comp_types : 2 * num_comp_types],
                     )
-                    status_text = (
-                        f"ERROR{(': ' + str(error_details)) if error_details else ''}"
+                except Exception:
+                    logger.exception(
+                        f"LiveViewTabController '{self.component_id}': failed to "
+                        "update data acquirer parameters."
                     )
-                    status_text = status_text[:100]
-                    status_color = "danger"
-                else:  # Unknown or other states
-                    button_text, button_color = "Start Acquisition", "warning"
-                    status_text, status_color = current_status, "warning"
 
-            return button_text, button_color, status_text, status_color
+            if not is_status_update:
+                return (dash.no_update,) * 4
+            displayed_status = args[2 * num_comp_types : 2 * num_comp_types + 4]
+            return self._handle_acquisition_status(
+                is_button_click, is_tab_active, displayed_status
+            )
 
-    def _register_parameter_update_callback(self, app: Dash) -> None:
+    def _handle_acquisition_status(
+        self,
+        is_button_click: bool,
+        is_tab_active: bool,
+        displayed_status: Tuple[Any, ...],
+    ) -> Tuple[Any, ...]:
+        """
+        Handles acquisition toggle and updates UI based on acquirer status.
 
-        """Registers callback for data acquirer parameter updates."""
-        all_acquirer_components = self._data_acquirer_instance.get_components()
+        Args:
+            is_button_click: Whether the toggle button triggered the update.
+            is_tab_active: Whether the Live View tab is currently selected.
+            displayed_status: The button text, button color, status text and
+                status color currently shown in the client's browser.
 
-        dynamic_inputs = [
-            Input(component._get_id(ALL), "value")
-            for component in all_acquirer_components
-        ]
-        dynamic_states_ids = [
-            State(component._get_id(ALL), "id") for component in all_acquirer_components
-        ]
+        Returns:
+            The button text, button color, status text and status color, or
+            `dash.no_update` for each if nothing needs to change.
+        """
+        if not is_button_click and not is_tab_active:
+            # Tab is hidden; skip polling the acquirer for a status refresh.
+            return (dash.no_update,) * 4
+
+        data_acquirer = self._data_acquirer_instance
+        try:
+            acquirer_state = data_acquirer.get_latest_data()
+        except ReferenceError:
+            logger.warning(
+                f"LiveViewTabController '{self.component_id}': data acquirer no "
+                "longer exists. Reporting acquisition as stopped."
+            )
+            acquirer_state = {"status": "stopped"}
+            is_button_click = False
+        current_status = acquirer_state.get("status", "unknown").upper()
+        error_details = acquirer_state.get("error")
 
-        @app.callback(
-            Output(
-                self._get_id(self._DUMMY_OUTPUT_ACQUIRER_UPDATE_SUFFIX),
-                component_property="children",
-            ),
-            dynamic_inputs,
-            dynamic_states_ids,
-            prevent_initial_call=True,
-        )
-        def handle_acquirer_parameter_update(*args: Any):
-            num_comp_types = len(all_acquirer_components)
-            values_by_type_list = args[:num_comp_types]
-            ids_by_type_list = args[num_comp_types : 2 * num_comp_types]
-
-            parameters_to_update: Dict[str, Dict[str, Any]] = {}
-
-            for i, component in enumerate(all_acquirer_components):
-                component_params = self._parse_component_parameters(
-                    component.component_id,
-                    values_by_type_list[i],
-                    ids_by_type_list[i],
+        new_status_tuple: Tuple[str, str, str, str]
+
+        if is_button_click:
+            logger.debug(
+                f"LiveViewTab: Toggle acquisition button clicked. "
+                f"Current reported acquirer status: {current_status}"
+            )
+            if current_status == "RUNNING":
+                logger.info(
+                    f"Attempting to stop acquisition for "
+                    f"'{data_acquirer.component_id}'"
+                )
+                data_acquirer.stop_acquisition()
+                new_status_tuple = _STATE_STOPPED
+            else:  # Was STOPPED, ERROR, or UNKNOWN
+                logger.info(
+                    f"Attempting to start acquisition for "
+                    f"'{data_acquirer.component_id}'"
+                )
+                data_acquirer.start_acquisition()
+                new_status_tuple = _STATE_RUNNING
+        else:
+            if current_status != "STOPPED":
+                logger.debug(
+                    f"LiveViewTab: Status update triggered externally. "
+                    f"Acquirer status: {current_status}"
+                )
+            if current_status == "RUNNING":
+                new_status_tuple = _STATE_RUNNING
+            elif current_status == "STOPPED":
+                new_status_tuple = _STATE_STOPPED
+            elif current_status == "ERROR":
+                if error_details:
+                    # Keep the badge text within 100 characters.
+                    error_text = str(error_details)
+                    if len(error_text) > 93:
+                        error_text = error_text[:90] + "..."
+                    status_text = f"ERROR: {error_text}"
+                else:
+                    status_text = "ERROR"
+                new_status_tuple = (
+                    "Start Acquisition",
+                    "success",
+                    status_text,
+                    "danger",
+                )
+            else:  # Unknown or other states
+                new_status_tuple = (
+                    "Start Acquisition",
+                    "warning",
+                    current_status,
+                    "warning",
                 )
 
-                if not component_params:
-                    continue
-                parameters_to_update[component.component_id] = component_params
+        if new_status_tuple == tuple(displayed_status):
+            return (dash.no_update,) * 4
+        return new_status_tuple
 
-            self._data_acquirer_instance.update_parameters(parameters_to_update)
+    def _handle_acquirer_parameter_update(
+        self,
+        component_ids: List[str],
+        values_by_type_list: Tuple[Any, ...],
+        ids_by_type_list: Tuple[Any, ...],
+    ) -> None:
+        """Forwards changed acquirer parameters from the UI to the acquirer."""
+        parameters_to_update: Dict[str, Dict[str, Any]] = {}
+
+        for component_id, values, ids in zip(
+            component_ids, values_by_type_list, ids_by_type_list
+        ):
+            component_params = self._parse_component_parameters(
+                component_id, values, ids
+            )
 
-            return dash.no_update
+            if not component_params:
+                continue
+            parameters_to_update[component_id] = component_params
+
+        changed_parameters = self._get_changed_parameters(parameters_to_update)
+        if not changed_parameters:
+            return
+        try:
+            self._data_acquirer_instance.update_parameters(changed_parameters)
+        except ReferenceError:
+            logger.warning(
+                f"LiveViewTabController '{self.component_id}': data acquirer no "
+                "longer exists. Parameter update ignored."
+            )
+            return
+        # Only record values the acquirer accepted, so a rejected update is
+        # retried when the same value arrives again.
+        for component_id, params in changed_parameters.items():
+            self._last_params_snapshot.setdefault(component_id, {}).update(params)
+
+    def _get_changed_parameters(
+        self, parameters: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns the parameters that differ from the last forwarded values."""
+        changed_parameters: Dict[str, Dict[str, Any]] = {}
+        for component_id, params in parameters.items():
+            last_params = self._last_params_snapshot.get(component_id, {})
+            changed = {
+                name: value
+                for name, value in params.items()
+                if name not in last_params or last_params[name] != value
+            }
+            if changed:
+                changed_parameters[component_id] = changed
+        return changed_parameters
 
     @staticmethod
     def _parse_component_parameters(
@@ -353,21 +522,22 @@ class LiveViewTabController(BaseTabController):
         if not values or not ids:
             return {}
 
+        if len(values) < len(ids):
+            logger.warning(
+                f"Values missing for param_ids {list(ids[len(values) :])} "
+                f"of type {component_id}"
+            )
+
         current_type_params: Dict[str, Any] = {}
-        for idx, param_id_dict in enumerate(ids):
-            if isinstance(param_id_dict, dict) and "index" in param_id_dict:
-                param_name = param_id_dict["index"]
-                if idx < len(values):
-                    param_value = values[idx]
+        warn = logger.warning
+        for param_id_dict, param_value in zip(ids, values):
+            if type(param_id_dict) is dict:
+                param_name = param_id_dict.get("index")
+                if param_name is not None:
                     current_type_params[param_name] = param_value
-                else:
-                    logger.warning(
-                        f"Value missing for param_id {param_id_dict} "
-                        f"of type {component_id}"
-                    )
-            else:
-                logger.warning(
-                    f"Unexpected ID format in acquirer params: "
-                    f"{param_id_dict} of type {component_id}"
-                )
+                    continue
+            warn(
+                f"Unexpected ID format in acquirer params: "
+                f"{param_id_dict} of type {component_id}"
+            )
         return current_type_params